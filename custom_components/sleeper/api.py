@@ -2,13 +2,31 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Any, TypeVar
 
 import aiohttp
 
+from homeassistant.util.json import json_loads
+
 from .const import API_BASE_URL
 from .models import LeagueInfo, LeagueUser, Matchup, NflState, Roster
 
+_T = TypeVar("_T")
+
+# Fail fast on a stalled connection rather than holding up the coordinator
+_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_read=7)
+
+# Sentinel returned by _request when Sleeper answers 304 Not Modified
+_NOT_MODIFIED = object()
+
+# (response header, request header) pairs used for conditional requests
+_VALIDATOR_HEADERS = (
+    ("ETag", "If-None-Match"),
+    ("Last-Modified", "If-Modified-Since"),
+)
+
 
 class SleeperApiConnectionError(Exception):
     """Exception for connection errors."""
@@ -19,19 +37,38 @@ class SleeperApiNotFoundError(Exception):
 
 
 class SleeperApiClient:
-    """Stateless client for the Sleeper API."""
+    """Client for the Sleeper API.
+
+    Rarely-changing resources are requested conditionally and their parsed
+    result is reused when Sleeper answers 304 Not Modified.
+    """
 
     def __init__(self, session: aiohttp.ClientSession) -> None:
         """Initialize the API client."""
         self._session = session
+        self._conditional_cache: dict[str, tuple[dict[str, str], Any]] = {}
 
-    async def _get(self, path: str) -> Any:
-        """Make a GET request and return the parsed JSON."""
+    async def _request(
+        self, path: str, headers: dict[str, str] | None = None
+    ) -> tuple[Any, dict[str, str]]:
+        """Make a GET request and return the parsed JSON and cache validators.
+
+        The JSON is replaced by _NOT_MODIFIED on a 304 response.
+        """
         url = f"{API_BASE_URL}{path}"
         try:
-            async with self._session.get(url) as resp:
+            async with self._session.get(
+                url, headers=headers, timeout=_TIMEOUT
+            ) as resp:
+                if resp.status == HTTPStatus.NOT_MODIFIED:
+                    return _NOT_MODIFIED, {}
                 resp.raise_for_status()
-                data = await resp.json()
+                data = await resp.json(loads=json_loads)
+                validators = {
+                    request_header: resp.headers[response_header]
+                    for response_header, request_header in _VALIDATOR_HEADERS
+                    if response_header in resp.headers
+                }
         except (aiohttp.ClientError, TimeoutError) as err:
             raise SleeperApiConnectionError(
                 f"Error connecting to Sleeper API: {err}"
@@ -40,16 +77,41 @@ class SleeperApiClient:
         if data is None:
             raise SleeperApiNotFoundError(f"Resource not found: {path}")
 
+        return data, validators
+
+    async def _get(self, path: str) -> Any:
+        """Make a GET request and return the parsed JSON."""
+        data, _ = await self._request(path)
         return data
 
+    async def _get_conditional(self, path: str, parse: Callable[[Any], _T]) -> _T:
+        """Make a conditional GET request and return the parsed result."""
+        cached = self._conditional_cache.get(path)
+        data, validators = await self._request(path, cached[0] if cached else None)
+        if data is _NOT_MODIFIED:
+            if cached is None:
+                raise SleeperApiConnectionError(
+                    f"Unexpected 304 Not Modified for uncached resource: {path}"
+                )
+            return cached[1]
+
+        result = parse(data)
+        if validators:
+            self._conditional_cache[path] = (validators, result)
+        else:
+            # Don't keep revalidating against a result older than this one
+            self._conditional_cache.pop(path, None)
+        return result
+
     async def async_get_user(self, username: str) -> dict[str, Any]:
         """Get a user by username. Returns raw dict with user_id etc."""
         return await self._get(f"/user/{username}")
 
     async def async_get_league(self, league_id: str) -> LeagueInfo:
         """Get league info."""
-        data = await self._get(f"/league/{league_id}")
-        return LeagueInfo.from_api(data)
+        return await self._get_conditional(
+            f"/league/{league_id}", LeagueInfo.from_api
+        )
 
     async def async_get_rosters(self, league_id: str) -> list[Roster]:
         """Get all rosters for a league."""
@@ -58,8 +120,10 @@ class SleeperApiClient:
 
     async def async_get_users(self, league_id: str) -> list[LeagueUser]:
         """Get all users in a league."""
-        data = await self._get(f"/league/{league_id}/users")
-        return [LeagueUser.from_api(u) for u in data]
+        return await self._get_conditional(
+            f"/league/{league_id}/users",
+            lambda data: [LeagueUser.from_api(u) for u in data],
+        )
 
     async def async_get_matchups(
         self, league_id: str, week: int
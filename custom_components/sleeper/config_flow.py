@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+from operator import attrgetter
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import SleeperApiClient, SleeperApiConnectionError, SleeperApiNotFoundError
@@ -25,6 +29,28 @@ class SleeperConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    _client: SleeperApiClient | None = None
+
+    def _get_client(self) -> SleeperApiClient:
+        """Return the API client, reused across form submissions."""
+        if self._client is None:
+            self._client = SleeperApiClient(async_get_clientsession(self.hass))
+        return self._client
+
+    @callback
+    def _async_prewarm(self) -> None:
+        """Open a connection to Sleeper while the user fills in the form."""
+
+        async def _prewarm() -> None:
+            with contextlib.suppress(
+                SleeperApiConnectionError, SleeperApiNotFoundError
+            ):
+                await self._get_client().async_get_nfl_state()
+
+        self.hass.async_create_background_task(
+            _prewarm(), "sleeper config flow prewarm"
+        )
+
     async def _validate_input(
         self, league_id: str, username: str
     ) -> tuple[dict[str, str], dict[str, Any]]:
@@ -34,18 +60,26 @@ class SleeperConfigFlow(ConfigFlow, domain=DOMAIN):
         and data holds the validated config values.
         """
         errors: dict[str, str] = {}
-        session = async_get_clientsession(self.hass)
-        client = SleeperApiClient(session)
+        client = self._get_client()
+
+        # Fetch everything needed for validation concurrently
+        requests = [client.async_get_league(league_id)]
+        if username:
+            requests.append(client.async_get_user(username))
+            requests.append(client.async_get_users(league_id))
+        league, *user_results = await asyncio.gather(
+            *requests, return_exceptions=True
+        )
 
         # Validate league
-        try:
-            league = await client.async_get_league(league_id)
-        except SleeperApiNotFoundError:
+        if isinstance(league, SleeperApiNotFoundError):
             errors[CONF_LEAGUE_ID] = "league_not_found"
             return errors, {}
-        except SleeperApiConnectionError:
+        if isinstance(league, SleeperApiConnectionError):
             errors["base"] = "cannot_connect"
             return errors, {}
+        if isinstance(league, BaseException):
+            raise league
 
         data: dict[str, Any] = {
             CONF_LEAGUE_ID: league_id,
@@ -56,25 +90,26 @@ class SleeperConfigFlow(ConfigFlow, domain=DOMAIN):
 
         # Validate optional username
         if username:
-            try:
-                user_info = await client.async_get_user(username)
-            except SleeperApiNotFoundError:
+            user_info, league_users = user_results
+            if isinstance(user_info, SleeperApiNotFoundError):
                 errors[CONF_USERNAME] = "user_not_found"
                 return errors, data
-            except SleeperApiConnectionError:
+            if isinstance(user_info, SleeperApiConnectionError):
                 errors["base"] = "cannot_connect"
                 return errors, data
+            if isinstance(user_info, BaseException):
+                raise user_info
 
             user_id = user_info.get("user_id", "")
 
             # Verify user is in the league
-            try:
-                league_users = await client.async_get_users(league_id)
-            except SleeperApiConnectionError:
+            if isinstance(league_users, SleeperApiConnectionError):
                 errors["base"] = "cannot_connect"
                 return errors, data
+            if isinstance(league_users, BaseException):
+                raise league_users
 
-            league_user_ids = {u.user_id for u in league_users}
+            league_user_ids = set(map(attrgetter("user_id"), league_users))
             if user_id not in league_user_ids:
                 errors[CONF_USERNAME] = "user_not_in_league"
                 return errors, data
@@ -105,6 +140,9 @@ class SleeperConfigFlow(ConfigFlow, domain=DOMAIN):
                     data=data,
                 )
 
+        if user_input is None:
+            self._async_prewarm()
+
         return self.async_show_form(
             step_id="user",
             data_schema=USER_SCHEMA,
@@ -131,6 +169,9 @@ class SleeperConfigFlow(ConfigFlow, domain=DOMAIN):
                     data={**entry.data, **data},
                 )
 
+        if user_input is None:
+            self._async_prewarm()
+
         return self.async_show_form(
             step_id="reconfigure",
             data_schema=vol.Schema(
@@ -16,3 +16,8 @@ UPDATE_INTERVAL_GAME_DAY = timedelta(minutes=15)
 UPDATE_INTERVAL_REGULAR = timedelta(hours=1)
 UPDATE_INTERVAL_OFFSEASON = timedelta(hours=24)
 
+NFL_STATE_CACHE_TTL = timedelta(hours=1)
+NFL_STATE_CACHE_TTL_WEEK_ROLLOVER = timedelta(minutes=5)
+
+# Longest time league data is reused while the offseason NFL state is unchanged
+OFFSEASON_FULL_REFRESH_INTERVAL = timedelta(days=7)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
 
 from homeassistant.config_entries import ConfigEntry
@@ -15,17 +17,27 @@ from .const import (
     CONF_LEAGUE_ID,
     CONF_USER_ID,
     DOMAIN,
+    NFL_STATE_CACHE_TTL,
+    NFL_STATE_CACHE_TTL_WEEK_ROLLOVER,
+    OFFSEASON_FULL_REFRESH_INTERVAL,
     UPDATE_INTERVAL_GAME_DAY,
     UPDATE_INTERVAL_GAME_WINDOW,
     UPDATE_INTERVAL_OFFSEASON,
     UPDATE_INTERVAL_REGULAR,
 )
-from .models import SleeperData
+from .models import NflState, SleeperData
 
 _LOGGER = logging.getLogger(__name__)
 
 EASTERN = ZoneInfo("US/Eastern")
 
+# Thursday (3), Sunday (6), Monday (0); Saturday (5) joins in weeks 15+ or postseason
+_GAME_DAYS_REGULAR = frozenset({0, 3, 6})
+_GAME_DAYS_LATE = frozenset({0, 3, 5, 6})
+
+# Hour (Eastern) each game day's window opens; windows close at midnight
+_GAME_WINDOW_START_HOUR = {0: 19, 3: 19, 5: 12, 6: 12}
+
 
 class SleeperCoordinator(DataUpdateCoordinator[SleeperData]):
     """Coordinator that fetches Sleeper data with adaptive polling."""
@@ -42,6 +54,11 @@ class SleeperCoordinator(DataUpdateCoordinator[SleeperData]):
         self.api = api
         self.league_id: str = config_entry.data[CONF_LEAGUE_ID]
         self.user_id: str | None = config_entry.data.get(CONF_USER_ID) or None
+        self.roster_ids: frozenset[int] = frozenset()
+        self.last_updated_iso: str | None = None
+        self._nfl_state_cache: tuple[float, NflState] | None = None
+        self._last_signature: tuple[str, str, int] | None = None
+        self._last_full_refresh: float = 0.0
 
         super().__init__(
             hass,
@@ -50,22 +67,36 @@ class SleeperCoordinator(DataUpdateCoordinator[SleeperData]):
             name=DOMAIN,
             update_interval=UPDATE_INTERVAL_REGULAR,
         )
+        self.update_interval_str = str(self.update_interval)
 
     async def _async_update_data(self) -> SleeperData:
         """Fetch all data from the Sleeper API."""
         try:
-            nfl_state = await self.api.async_get_nfl_state()
-            league = await self.api.async_get_league(self.league_id)
-            rosters = await self.api.async_get_rosters(self.league_id)
-            users = await self.api.async_get_users(self.league_id)
+            nfl_state = await self._async_get_nfl_state()
+
+            signature = (nfl_state.season, nfl_state.season_type, nfl_state.week)
+            if self._can_reuse_data(signature):
+                _LOGGER.debug(
+                    "NFL state unchanged in offseason, reusing data for league %s",
+                    self.league_id,
+                )
+                return self.data
 
             # Only fetch matchups during regular or post season
             if nfl_state.season_type in ("regular", "post"):
-                matchups = await self.api.async_get_matchups(
+                matchups_task = self.api.async_get_matchups(
                     self.league_id, nfl_state.week
                 )
             else:
-                matchups = []
+                matchups_task = asyncio.sleep(0, result=[])
+
+            # The remaining endpoints are independent, so fetch them concurrently
+            league, rosters, users, matchups = await asyncio.gather(
+                self.api.async_get_league(self.league_id),
+                self.api.async_get_rosters(self.league_id),
+                self.api.async_get_users(self.league_id),
+                matchups_task,
+            )
 
         except SleeperApiConnectionError as err:
             raise UpdateFailed(f"Error communicating with Sleeper API: {err}") from err
@@ -81,8 +112,19 @@ class SleeperCoordinator(DataUpdateCoordinator[SleeperData]):
             user_id=self.user_id,
         )
 
+        # Only replace the set when rosters change so listeners can compare
+        # by identity
+        roster_ids = frozenset(data.roster_by_id)
+        if roster_ids != self.roster_ids:
+            self.roster_ids = roster_ids
+
+        self.last_updated_iso = datetime.now(timezone.utc).isoformat()
+        self._last_signature = signature
+        self._last_full_refresh = time.monotonic()
+
         # Recalculate polling interval based on current state
         self.update_interval = self._calculate_update_interval(nfl_state.season_type, nfl_state.week)
+        self.update_interval_str = str(self.update_interval)
         _LOGGER.debug(
             "Update interval set to %s for league %s",
             self.update_interval,
@@ -91,6 +133,37 @@ class SleeperCoordinator(DataUpdateCoordinator[SleeperData]):
 
         return data
 
+    def _can_reuse_data(self, signature: tuple[str, str, int]) -> bool:
+        """Check if the previous data can be reused without a full fetch."""
+        return (
+            signature[1] == "off"
+            and self.data is not None
+            and signature == self._last_signature
+            and time.monotonic() - self._last_full_refresh
+            < OFFSEASON_FULL_REFRESH_INTERVAL.total_seconds()
+        )
+
+    async def _async_get_nfl_state(self) -> NflState:
+        """Return the NFL state, reusing the cached value while it is fresh."""
+        now = time.monotonic()
+        if self._nfl_state_cache is not None:
+            fetched_at, nfl_state = self._nfl_state_cache
+            if now - fetched_at < self._nfl_state_ttl().total_seconds():
+                return nfl_state
+
+        nfl_state = await self.api.async_get_nfl_state()
+        self._nfl_state_cache = (now, nfl_state)
+        return nfl_state
+
+    @staticmethod
+    def _nfl_state_ttl() -> timedelta:
+        """Return how long a fetched NFL state may be reused."""
+        # Sleeper advances the week (and season_type transitions) after the
+        # Monday night game, so refresh more often Tuesday and Wednesday.
+        if datetime.now(EASTERN).weekday() in (1, 2):
+            return NFL_STATE_CACHE_TTL_WEEK_ROLLOVER
+        return NFL_STATE_CACHE_TTL
+
     def _calculate_update_interval(
         self, season_type: str, week: int
     ) -> timedelta:
@@ -119,39 +192,17 @@ class SleeperCoordinator(DataUpdateCoordinator[SleeperData]):
         day_of_week: int, week: int, season_type: str
     ) -> bool:
         """Check if today is an NFL game day."""
-        # Thursday (3), Sunday (6), Monday (0)
-        if day_of_week in (0, 3, 6):
-            return True
-
-        # Saturday (5) only during weeks 15+ or postseason
-        if day_of_week == 5 and (week >= 15 or season_type == "post"):
-            return True
-
-        return False
+        if week >= 15 or season_type == "post":
+            return day_of_week in _GAME_DAYS_LATE
+        return day_of_week in _GAME_DAYS_REGULAR
 
     @staticmethod
     def _is_in_game_window(
         day_of_week: int, hour: int, week: int, season_type: str
     ) -> bool:
         """Check if we're currently in a game window."""
-        # Thursday: 7 PM - 12 AM (19-23)
-        if day_of_week == 3 and hour >= 19:
-            return True
-
-        # Sunday: 12 PM - 12 AM (12-23)
-        if day_of_week == 6 and hour >= 12:
-            return True
-
-        # Monday: 7 PM - 12 AM (19-23)
-        if day_of_week == 0 and hour >= 19:
-            return True
-
-        # Saturday: 12 PM - 12 AM (12-23), only weeks 15+ or postseason
-        if (
-            day_of_week == 5
-            and hour >= 12
-            and (week >= 15 or season_type == "post")
-        ):
-            return True
-
-        return False
+        # Windows run from the start hour until midnight; Saturday only
+        # counts during weeks 15+ or postseason
+        return hour >= _GAME_WINDOW_START_HOUR.get(day_of_week, 24) and (
+            day_of_week != 5 or week >= 15 or season_type == "post"
+        )
@@ -2,26 +2,44 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 
 from . import SleeperConfigEntry
 
-REDACT_FIELDS = {"user_id", "owner_id"}
+REDACT_FIELDS = frozenset({"user_id", "owner_id"})
+
+# Exact types only: the data comes from as_dict(), which builds plain dicts/lists
+_CONTAINER_TYPES = (dict, list)
 
 
 def _redact(data: Any) -> Any:
-    """Recursively redact sensitive fields from a data structure."""
-    if isinstance(data, dict):
-        return {
-            key: "**REDACTED**" if key in REDACT_FIELDS else _redact(value)
-            for key, value in data.items()
-        }
-    if isinstance(data, list):
-        return [_redact(item) for item in data]
-    return data
+    """Redact sensitive fields from a nested data structure without recursion."""
+    root: list[Any] = [data]
+    stack: list[tuple[Any, Any, Any]] = [(root, 0, data)]
+    while stack:
+        parent, key, value = stack.pop()
+        value_type = type(value)
+        if value_type is dict:
+            redacted: dict[Any, Any] = {}
+            parent[key] = redacted
+            for item_key, item in value.items():
+                if item_key in REDACT_FIELDS:
+                    redacted[item_key] = "**REDACTED**"
+                else:
+                    redacted[item_key] = item
+                    if type(item) in _CONTAINER_TYPES:
+                        stack.append((redacted, item_key, item))
+        elif value_type is list:
+            items = list(value)
+            parent[key] = items
+            stack.extend(
+                (items, index, item)
+                for index, item in enumerate(items)
+                if type(item) in _CONTAINER_TYPES
+            )
+    return root[0]
 
 
 async def async_get_config_entry_diagnostics(
@@ -32,5 +50,4 @@ async def async_get_config_entry_diagnostics(
     coordinator = entry.runtime_data
     if coordinator.data is None:
         return {"error": "No data available yet"}
-    data = asdict(coordinator.data)
-    return _redact(data)
+    return _redact(coordinator.data.as_dict())
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NflState:
     """Represents the current NFL state."""
 
@@ -23,8 +24,16 @@ class NflState:
             season_type=data.get("season_type", "off"),
         )
 
+    def as_dict(self) -> dict[str, Any]:
+        """Return a plain dict representation."""
+        return {
+            "week": self.week,
+            "season": self.season,
+            "season_type": self.season_type,
+        }
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class LeagueInfo:
     """Represents league information."""
 
@@ -45,8 +54,18 @@ class LeagueInfo:
             total_rosters=data.get("total_rosters", 0),
         )
 
+    def as_dict(self) -> dict[str, Any]:
+        """Return a plain dict representation."""
+        return {
+            "league_id": self.league_id,
+            "name": self.name,
+            "status": self.status,
+            "season": self.season,
+            "total_rosters": self.total_rosters,
+        }
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Roster:
     """Represents a roster in the league."""
 
@@ -55,34 +74,66 @@ class Roster:
     wins: int
     losses: int
     ties: int
-    fpts: float
+    # Exact integer points; fpts is derived from it so the two always agree
+    fpts_hundredths: int = field(repr=False)
+    fpts: float = field(init=False)
     fpts_against: float
     waiver_position: int
     total_moves: int
+    points_per_game: float = field(init=False, repr=False)
+    record: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Compute derived fields."""
+        object.__setattr__(self, "fpts", self.fpts_hundredths / 100)
+        games = self.wins + self.losses + self.ties
+        object.__setattr__(
+            self, "points_per_game", round(self.fpts / max(games, 1), 2)
+        )
+        object.__setattr__(
+            self, "record", f"{self.wins}-{self.losses}-{self.ties}"
+        )
 
     @classmethod
     def from_api(cls, data: dict[str, Any]) -> Roster:
         """Create from API response."""
-        settings = data.get("settings") or {}
-        fpts_int = settings.get("fpts") or 0
-        fpts_dec = settings.get("fpts_decimal") or 0
-        fpts_against_int = settings.get("fpts_against") or 0
-        fpts_against_dec = settings.get("fpts_against_decimal") or 0
+        # Bind the lookup once; values may be null, hence the "or 0"
+        get = (data.get("settings") or {}).get
+        # Points are split into whole and hundredths; combine them as integers
+        # so only a single, correctly rounded division is needed
+        fpts_hundredths = (get("fpts") or 0) * 100 + (get("fpts_decimal") or 0)
+        fpts_against_hundredths = (get("fpts_against") or 0) * 100 + (
+            get("fpts_against_decimal") or 0
+        )
 
         return cls(
             roster_id=data.get("roster_id", 0),
             owner_id=data.get("owner_id"),
-            wins=settings.get("wins") or 0,
-            losses=settings.get("losses") or 0,
-            ties=settings.get("ties") or 0,
-            fpts=fpts_int + fpts_dec / 100,
-            fpts_against=fpts_against_int + fpts_against_dec / 100,
-            waiver_position=settings.get("waiver_position") or 0,
-            total_moves=settings.get("total_moves") or 0,
+            wins=get("wins") or 0,
+            losses=get("losses") or 0,
+            ties=get("ties") or 0,
+            fpts_hundredths=fpts_hundredths,
+            fpts_against=fpts_against_hundredths / 100,
+            waiver_position=get("waiver_position") or 0,
+            total_moves=get("total_moves") or 0,
         )
 
+    def as_dict(self) -> dict[str, Any]:
+        """Return a plain dict representation."""
+        return {
+            "roster_id": self.roster_id,
+            "owner_id": self.owner_id,
+            "wins": self.wins,
+            "losses": self.losses,
+            "ties": self.ties,
+            "fpts": self.fpts,
+            "fpts_against": self.fpts_against,
+            "waiver_position": self.waiver_position,
+            "total_moves": self.total_moves,
+        }
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LeagueUser:
     """Represents a user in the league."""
 
@@ -100,8 +151,16 @@ class LeagueUser:
             team_name=metadata.get("team_name"),
         )
 
+    def as_dict(self) -> dict[str, Any]:
+        """Return a plain dict representation."""
+        return {
+            "user_id": self.user_id,
+            "display_name": self.display_name,
+            "team_name": self.team_name,
+        }
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Matchup:
     """Represents a matchup entry."""
 
@@ -118,8 +177,22 @@ class Matchup:
             points=data.get("points") or 0.0,
         )
 
+    def as_dict(self) -> dict[str, Any]:
+        """Return a plain dict representation."""
+        return {
+            "roster_id": self.roster_id,
+            "matchup_id": self.matchup_id,
+            "points": self.points,
+        }
+
 
-@dataclass
+_UNKNOWN_USER = LeagueUser(user_id="", display_name="Unknown", team_name=None)
+_STANDINGS_KEY = attrgetter("wins", "fpts_hundredths")
+_ROSTER_ID = attrgetter("roster_id")
+_USER_ID = attrgetter("user_id")
+
+
+@dataclass(slots=True)
 class SleeperData:
     """Aggregated data from all Sleeper API endpoints."""
 
@@ -129,9 +202,16 @@ class SleeperData:
     users: list[LeagueUser]
     matchups: list[Matchup]
     roster_to_user: dict[int, LeagueUser] = field(default_factory=dict)
+    roster_by_id: dict[int, Roster] = field(default_factory=dict)
+    roster_display: dict[int, tuple[str, str | None]] = field(default_factory=dict)
     standings: list[int] = field(default_factory=list)
+    standing_by_roster: dict[int, int] = field(default_factory=dict)
+    matchup_by_roster: dict[int, Matchup] = field(default_factory=dict)
+    matchup_pairs: dict[int, list[Matchup]] = field(default_factory=dict)
     my_roster: Roster | None = None
     my_user: LeagueUser | None = None
+    my_matchup: Matchup | None = None
+    my_opponent_matchup: Matchup | None = None
 
     @staticmethod
     def build(
@@ -144,31 +224,51 @@ class SleeperData:
     ) -> SleeperData:
         """Build aggregated data with computed fields."""
         # Map owner_id -> LeagueUser
-        user_by_id: dict[str, LeagueUser] = {u.user_id: u for u in users}
-        placeholder = LeagueUser(user_id="", display_name="Unknown", team_name=None)
+        user_by_id: dict[str, LeagueUser] = dict(zip(map(_USER_ID, users), users))
 
+        # Map roster_id -> LeagueUser/Roster and find my roster in the same pass
         roster_to_user: dict[int, LeagueUser] = {}
+        roster_by_id: dict[int, Roster] = {}
+        roster_display: dict[int, tuple[str, str | None]] = {}
+        my_roster: Roster | None = None
         for roster in rosters:
-            if roster.owner_id and roster.owner_id in user_by_id:
-                roster_to_user[roster.roster_id] = user_by_id[roster.owner_id]
-            else:
-                roster_to_user[roster.roster_id] = placeholder
+            user = user_by_id.get(roster.owner_id, _UNKNOWN_USER)
+            roster_to_user[roster.roster_id] = user
+            roster_by_id[roster.roster_id] = roster
+            roster_display[roster.roster_id] = (user.display_name, user.team_name)
+            if user_id and my_roster is None and roster.owner_id == user_id:
+                my_roster = roster
 
         # Standings: sort by wins desc, then fpts desc
-        sorted_rosters = sorted(
-            rosters, key=lambda r: (r.wins, r.fpts), reverse=True
-        )
-        standings = [r.roster_id for r in sorted_rosters]
+        sorted_rosters = sorted(rosters, key=_STANDINGS_KEY, reverse=True)
+        standings = list(map(_ROSTER_ID, sorted_rosters))
+        standing_by_roster = {
+            roster_id: rank for rank, roster_id in enumerate(standings, 1)
+        }
 
-        # My roster/user lookup
-        my_roster: Roster | None = None
-        my_user: LeagueUser | None = None
-        if user_id:
-            my_user = user_by_id.get(user_id)
-            for roster in rosters:
-                if roster.owner_id == user_id:
-                    my_roster = roster
-                    break
+        my_user = user_by_id.get(user_id) if user_id else None
+
+        # Group matchups by matchup_id (None means a bye) and pair mine up
+        matchup_by_roster: dict[int, Matchup] = {}
+        matchup_pairs: dict[int, list[Matchup]] = {}
+        for matchup in matchups:
+            matchup_by_roster[matchup.roster_id] = matchup
+            if matchup.matchup_id is not None:
+                matchup_pairs.setdefault(matchup.matchup_id, []).append(matchup)
+
+        my_matchup: Matchup | None = None
+        my_opponent_matchup: Matchup | None = None
+        if my_roster is not None:
+            my_matchup = matchup_by_roster.get(my_roster.roster_id)
+            if my_matchup is not None and my_matchup.matchup_id is not None:
+                my_opponent_matchup = next(
+                    (
+                        m
+                        for m in matchup_pairs[my_matchup.matchup_id]
+                        if m.roster_id != my_roster.roster_id
+                    ),
+                    None,
+                )
 
         return SleeperData(
             nfl_state=nfl_state,
@@ -177,7 +277,36 @@ class SleeperData:
             users=users,
             matchups=matchups,
             roster_to_user=roster_to_user,
+            roster_by_id=roster_by_id,
+            roster_display=roster_display,
             standings=standings,
+            standing_by_roster=standing_by_roster,
+            matchup_by_roster=matchup_by_roster,
+            matchup_pairs=matchup_pairs,
             my_roster=my_roster,
             my_user=my_user,
+            my_matchup=my_matchup,
+            my_opponent_matchup=my_opponent_matchup,
         )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a plain dict representation of all aggregated data.
+
+        Lookup indexes derived from the lists (roster_by_id, roster_display,
+        standing_by_roster, matchup_by_roster, matchup_pairs and the
+        my_matchup pairing) are omitted.
+        """
+        return {
+            "nfl_state": self.nfl_state.as_dict(),
+            "league": self.league.as_dict(),
+            "rosters": [r.as_dict() for r in self.rosters],
+            "users": [u.as_dict() for u in self.users],
+            "matchups": [m.as_dict() for m in self.matchups],
+            "roster_to_user": {
+                roster_id: user.as_dict()
+                for roster_id, user in self.roster_to_user.items()
+            },
+            "standings": list(self.standings),
+            "my_roster": self.my_roster.as_dict() if self.my_roster else None,
+            "my_user": self.my_user.as_dict() if self.my_user else None,
+        }
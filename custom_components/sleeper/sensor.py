@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
@@ -30,47 +30,44 @@ class SleeperSensorEntityDescription(SensorEntityDescription):
     attr_fn: Callable[[SleeperData], dict[str, Any] | None]
 
 
-def _make_roster_description(roster_id: int) -> SleeperSensorEntityDescription:
-    """Create a sensor description for a specific roster."""
-    return SleeperSensorEntityDescription(
-        key=f"roster_{roster_id}_record",
-        translation_key="roster_record",
-        value_fn=lambda data, rid=roster_id: _roster_record(data, rid),
-        attr_fn=lambda data, rid=roster_id: _roster_attrs(data, rid),
-    )
+@dataclass(frozen=True, kw_only=True)
+class SleeperRosterSensorEntityDescription(SensorEntityDescription):
+    """Describes a per-roster Sleeper sensor entity.
+
+    Shared by all roster entities; the callables receive the entity's roster_id.
+    """
+
+    value_fn: Callable[[SleeperData, int], Any]
+    attr_fn: Callable[[SleeperData, int], dict[str, Any] | None]
 
 
 def _roster_record(data: SleeperData, roster_id: int) -> str | None:
     """Get the W-L-T record for a roster."""
-    for roster in data.rosters:
-        if roster.roster_id == roster_id:
-            return f"{roster.wins}-{roster.losses}-{roster.ties}"
-    return None
+    roster = data.roster_by_id.get(roster_id)
+    if roster is None:
+        return None
+    return roster.record
 
 
 def _roster_attrs(data: SleeperData, roster_id: int) -> dict[str, Any] | None:
     """Get extra attributes for a roster sensor."""
-    for roster in data.rosters:
-        if roster.roster_id == roster_id:
-            user = data.roster_to_user.get(roster_id)
-            standing = (
-                data.standings.index(roster_id) + 1
-                if roster_id in data.standings
-                else 0
-            )
-            return {
-                "wins": roster.wins,
-                "losses": roster.losses,
-                "ties": roster.ties,
-                "fpts": roster.fpts,
-                "fpts_against": roster.fpts_against,
-                "standing": standing,
-                "display_name": user.display_name if user else "Unknown",
-                "team_name": user.team_name if user else None,
-                "waiver_position": roster.waiver_position,
-                "total_moves": roster.total_moves,
-            }
-    return None
+    roster = data.roster_by_id.get(roster_id)
+    if roster is None:
+        return None
+    display_name, team_name = data.roster_display.get(roster_id, ("Unknown", None))
+    standing = data.standing_by_roster.get(roster_id, 0)
+    return {
+        "wins": roster.wins,
+        "losses": roster.losses,
+        "ties": roster.ties,
+        "fpts": roster.fpts,
+        "fpts_against": roster.fpts_against,
+        "standing": standing,
+        "display_name": display_name,
+        "team_name": team_name,
+        "waiver_position": roster.waiver_position,
+        "total_moves": roster.total_moves,
+    }
 
 
 def _my_matchup_state(data: SleeperData) -> str | None:
@@ -78,71 +75,85 @@ def _my_matchup_state(data: SleeperData) -> str | None:
     if data.my_roster is None:
         return None
 
-    my_matchup_id: int | None = None
-    my_points: float = 0.0
-    for m in data.matchups:
-        if m.roster_id == data.my_roster.roster_id:
-            my_matchup_id = m.matchup_id
-            my_points = m.points
-            break
-
-    if my_matchup_id is None:
+    opponent = data.my_opponent_matchup
+    if opponent is None:
         return "BYE"
 
-    # Find opponent
-    for m in data.matchups:
-        if m.matchup_id == my_matchup_id and m.roster_id != data.my_roster.roster_id:
-            return f"{my_points} - {m.points}"
-
-    return "BYE"
+    return f"{data.my_matchup.points} - {opponent.points}"
 
 
 def _my_matchup_attrs(data: SleeperData) -> dict[str, Any] | None:
     """Get extra attributes for my matchup sensor."""
-    if data.my_roster is None:
+    opponent = data.my_opponent_matchup
+    if opponent is None:
         return {"opponent_name": None, "opponent_points": None, "week": data.nfl_state.week}
 
-    my_matchup_id: int | None = None
-    for m in data.matchups:
-        if m.roster_id == data.my_roster.roster_id:
-            my_matchup_id = m.matchup_id
-            break
+    opp_user = data.roster_to_user.get(opponent.roster_id)
+    opp_name = opp_user.display_name if opp_user else "Unknown"
+    return {
+        "opponent_name": opp_name,
+        "opponent_points": opponent.points,
+        "week": data.nfl_state.week,
+    }
 
-    if my_matchup_id is None:
-        return {"opponent_name": None, "opponent_points": None, "week": data.nfl_state.week}
 
-    for m in data.matchups:
-        if m.matchup_id == my_matchup_id and m.roster_id != data.my_roster.roster_id:
-            opp_user = data.roster_to_user.get(m.roster_id)
-            opp_name = opp_user.display_name if opp_user else "Unknown"
-            return {
-                "opponent_name": opp_name,
-                "opponent_points": m.points,
-                "week": data.nfl_state.week,
-            }
+def _league_status_attrs(data: SleeperData) -> dict[str, Any]:
+    """Get extra attributes for the league status sensor."""
+    return {
+        "league_name": data.league.name,
+        "season": data.league.season,
+        "total_rosters": data.league.total_rosters,
+    }
+
 
-    return {"opponent_name": None, "opponent_points": None, "week": data.nfl_state.week}
+def _nfl_week_attrs(data: SleeperData) -> dict[str, Any]:
+    """Get extra attributes for the NFL week sensor."""
+    return {
+        "season": data.nfl_state.season,
+        "season_type": data.nfl_state.season_type,
+    }
+
+
+def _my_record_attrs(data: SleeperData) -> dict[str, Any] | None:
+    """Get extra attributes for my record sensor."""
+    if data.my_roster is None:
+        return None
+    return {
+        "wins": data.my_roster.wins,
+        "losses": data.my_roster.losses,
+        "ties": data.my_roster.ties,
+        "fpts": data.my_roster.fpts,
+        "fpts_against": data.my_roster.fpts_against,
+    }
+
+
+def _my_points_attrs(data: SleeperData) -> dict[str, Any] | None:
+    """Get extra attributes for my points sensor."""
+    if data.my_roster is None:
+        return None
+    return {
+        "fpts_against": data.my_roster.fpts_against,
+        "points_per_game": data.my_roster.points_per_game,
+    }
+
+
+def _my_standing_attrs(data: SleeperData) -> dict[str, Any]:
+    """Get extra attributes for my standing sensor."""
+    return {"total_teams": len(data.standings)}
 
 
 LEAGUE_SENSORS: tuple[SleeperSensorEntityDescription, ...] = (
     SleeperSensorEntityDescription(
         key="league_status",
         translation_key="league_status",
-        value_fn=lambda data: data.league.status,
-        attr_fn=lambda data: {
-            "league_name": data.league.name,
-            "season": data.league.season,
-            "total_rosters": data.league.total_rosters,
-        },
+        value_fn=attrgetter("league.status"),
+        attr_fn=_league_status_attrs,
     ),
     SleeperSensorEntityDescription(
         key="nfl_week",
         translation_key="nfl_week",
-        value_fn=lambda data: data.nfl_state.week,
-        attr_fn=lambda data: {
-            "season": data.nfl_state.season,
-            "season_type": data.nfl_state.season_type,
-        },
+        value_fn=attrgetter("nfl_state.week"),
+        attr_fn=_nfl_week_attrs,
     ),
 )
 
@@ -150,42 +161,14 @@ MY_TEAM_SENSORS: tuple[SleeperSensorEntityDescription, ...] = (
     SleeperSensorEntityDescription(
         key="my_record",
         translation_key="my_record",
-        value_fn=lambda data: (
-            f"{data.my_roster.wins}-{data.my_roster.losses}-{data.my_roster.ties}"
-            if data.my_roster
-            else "0-0-0"
-        ),
-        attr_fn=lambda data: (
-            {
-                "wins": data.my_roster.wins,
-                "losses": data.my_roster.losses,
-                "ties": data.my_roster.ties,
-                "fpts": data.my_roster.fpts,
-                "fpts_against": data.my_roster.fpts_against,
-            }
-            if data.my_roster
-            else None
-        ),
+        value_fn=lambda data: data.my_roster.record if data.my_roster else "0-0-0",
+        attr_fn=_my_record_attrs,
     ),
     SleeperSensorEntityDescription(
         key="my_points",
         translation_key="my_points",
         value_fn=lambda data: data.my_roster.fpts if data.my_roster else 0.0,
-        attr_fn=lambda data: (
-            {
-                "fpts_against": data.my_roster.fpts_against,
-                "points_per_game": round(
-                    data.my_roster.fpts
-                    / max(
-                        data.my_roster.wins + data.my_roster.losses + data.my_roster.ties,
-                        1,
-                    ),
-                    2,
-                ),
-            }
-            if data.my_roster
-            else None
-        ),
+        attr_fn=_my_points_attrs,
     ),
     SleeperSensorEntityDescription(
         key="my_matchup",
@@ -197,66 +180,110 @@ MY_TEAM_SENSORS: tuple[SleeperSensorEntityDescription, ...] = (
         key="my_standing",
         translation_key="my_standing",
         value_fn=lambda data: (
-            data.standings.index(data.my_roster.roster_id) + 1
-            if data.my_roster and data.my_roster.roster_id in data.standings
+            data.standing_by_roster.get(data.my_roster.roster_id, 0)
+            if data.my_roster
             else 0
         ),
-        attr_fn=lambda data: {"total_teams": len(data.standings)},
+        attr_fn=_my_standing_attrs,
     ),
 )
 
+# SleeperDiagnosticSensorEntity reads the coordinator directly; value_fn and
+# attr_fn are required by the description but intentionally never called
 DIAGNOSTIC_SENSOR = SleeperSensorEntityDescription(
     key="last_updated",
     translation_key="last_updated",
     entity_category=EntityCategory.DIAGNOSTIC,
-    value_fn=lambda data: datetime.now(timezone.utc).isoformat(),
-    attr_fn=lambda data: None,  # Populated in entity class with coordinator info
+    value_fn=lambda data: None,
+    attr_fn=lambda data: None,
+)
+
+ROSTER_DESCRIPTION = SleeperRosterSensorEntityDescription(
+    key="roster_record",
+    translation_key="roster_record",
+    value_fn=_roster_record,
+    attr_fn=_roster_attrs,
 )
 
 
 class SleeperSensorEntity(CoordinatorEntity[SleeperCoordinator], SensorEntity):
     """Base class for Sleeper sensor entities."""
 
-    entity_description: SleeperSensorEntityDescription
+    # Parent classes still carry a __dict__; this keeps our own state out of it
+    __slots__ = ("_roster_id",)
+
+    entity_description: (
+        SleeperSensorEntityDescription | SleeperRosterSensorEntityDescription
+    )
     _attr_has_entity_name = True
 
     def __init__(
         self,
         coordinator: SleeperCoordinator,
-        description: SleeperSensorEntityDescription,
+        description: (
+            SleeperSensorEntityDescription | SleeperRosterSensorEntityDescription
+        ),
         league_id: str,
-        league_name: str,
+        device_info: DeviceInfo,
         roster_id: int | None = None,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{league_id}_{description.key}"
+        self._roster_id = roster_id
+        if roster_id is None:
+            self._attr_unique_id = f"{league_id}_{description.key}"
+        else:
+            self._attr_unique_id = f"{league_id}_roster_{roster_id}_record"
         self._attr_translation_key = description.translation_key
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, league_id)},
-            name=league_name,
-            manufacturer="Sleeper",
-            model="Fantasy League",
-        )
+        self._attr_device_info = device_info
         if roster_id is not None:
-            user = coordinator.data.roster_to_user.get(roster_id)
-            display_name = user.display_name if user else f"Roster {roster_id}"
+            display_name, _ = coordinator.data.roster_display.get(
+                roster_id, (f"Roster {roster_id}", None)
+            )
             self._attr_translation_placeholders = {"display_name": display_name}
+        self._update_from_coordinator()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the state and attributes when the coordinator has new data."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Compute the state and attributes from the coordinator data."""
+        data = self.coordinator.data
+        description = self.entity_description
+        if self._roster_id is None:
+            self._attr_native_value = description.value_fn(data)
+            self._attr_extra_state_attributes = description.attr_fn(data)
+        else:
+            self._attr_native_value = description.value_fn(data, self._roster_id)
+            self._attr_extra_state_attributes = description.attr_fn(
+                data, self._roster_id
+            )
+
+
+class SleeperDiagnosticSensorEntity(SleeperSensorEntity):
+    """Diagnostic sensor reporting the coordinator's refresh state."""
+
+    __slots__ = ()
 
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.coordinator.data)
+    def _update_from_coordinator(self) -> None:
+        """Report the last refresh time and the current polling interval."""
+        self._attr_native_value = self.coordinator.last_updated_iso
+        self._attr_extra_state_attributes = {
+            "update_interval": self.coordinator.update_interval_str,
+        }
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return extra state attributes."""
-        if self.entity_description.key == "last_updated":
-            return {
-                "update_interval": str(self.coordinator.update_interval),
-            }
-        return self.entity_description.attr_fn(self.coordinator.data)
+
+# Entities created once per league regardless of configuration
+_STATIC_LEAGUE_ENTITIES: tuple[
+    tuple[type[SleeperSensorEntity], SleeperSensorEntityDescription], ...
+] = (
+    *((SleeperSensorEntity, description) for description in LEAGUE_SENSORS),
+    (SleeperDiagnosticSensorEntity, DIAGNOSTIC_SENSOR),
+)
 
 
 async def async_setup_entry(
@@ -267,63 +294,67 @@ async def async_setup_entry(
     """Set up Sleeper sensor entities from a config entry."""
     coordinator: SleeperCoordinator = entry.runtime_data
     league_id = coordinator.league_id
-    league_name = coordinator.data.league.name
 
-    entities: list[SleeperSensorEntity] = []
-
-    # League sensors (always created)
-    for description in LEAGUE_SENSORS:
-        entities.append(
-            SleeperSensorEntity(coordinator, description, league_id, league_name)
-        )
+    # One DeviceInfo shared by every entity of this league
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, league_id)},
+        name=coordinator.data.league.name,
+        manufacturer="Sleeper",
+        model="Fantasy League",
+    )
 
-    # Diagnostic sensor (always created)
-    entities.append(
-        SleeperSensorEntity(coordinator, DIAGNOSTIC_SENSOR, league_id, league_name)
+    # My team sensors only when user is configured and found in league
+    my_team_descriptions = (
+        MY_TEAM_SENSORS if coordinator.data.my_roster is not None else ()
     )
 
-    # Per-roster sensors
-    known_roster_ids: set[int] = set()
-    for roster in coordinator.data.rosters:
-        known_roster_ids.add(roster.roster_id)
-        description = _make_roster_description(roster.roster_id)
-        entities.append(
+    # League and diagnostic, per-roster and my team sensors
+    entities: list[SleeperSensorEntity] = [
+        *(
+            entity_cls(coordinator, description, league_id, device_info)
+            for entity_cls, description in _STATIC_LEAGUE_ENTITIES
+        ),
+        *(
             SleeperSensorEntity(
-                coordinator, description, league_id, league_name,
+                coordinator, ROSTER_DESCRIPTION, league_id, device_info,
                 roster_id=roster.roster_id,
             )
-        )
-
-    # My team sensors (only when user is configured and found in league)
-    if coordinator.data.my_roster is not None:
-        for description in MY_TEAM_SENSORS:
-            entities.append(
-                SleeperSensorEntity(coordinator, description, league_id, league_name)
-            )
+            for roster in coordinator.data.rosters
+        ),
+        *(
+            SleeperSensorEntity(coordinator, description, league_id, device_info)
+            for description in my_team_descriptions
+        ),
+    ]
+    known_roster_ids: set[int] = set(coordinator.roster_ids)
 
     async_add_entities(entities)
 
     # Register a listener to detect new rosters on each update
+    last_seen_roster_ids = coordinator.roster_ids
+
     @callback
     def _async_check_new_rosters() -> None:
         """Check for new rosters and add entities for them."""
-        nonlocal known_roster_ids
-        new_entities: list[SleeperSensorEntity] = []
-        current_roster_ids: set[int] = set()
-
-        for roster in coordinator.data.rosters:
-            current_roster_ids.add(roster.roster_id)
-            if roster.roster_id not in known_roster_ids:
-                description = _make_roster_description(roster.roster_id)
-                new_entities.append(
-                    SleeperSensorEntity(
-                        coordinator, description, league_id, league_name,
-                        roster_id=roster.roster_id,
-                    )
+        nonlocal last_seen_roster_ids
+        # The coordinator keeps the same frozenset while rosters are unchanged
+        if coordinator.roster_ids is last_seen_roster_ids:
+            return
+        last_seen_roster_ids = coordinator.roster_ids
+
+        new_roster_ids = last_seen_roster_ids - known_roster_ids
+        if not new_roster_ids:
+            return
+
+        known_roster_ids.update(new_roster_ids)
+        async_add_entities(
+            [
+                SleeperSensorEntity(
+                    coordinator, ROSTER_DESCRIPTION, league_id, device_info,
+                    roster_id=roster_id,
                 )
-
-        if new_entities:
-            known_roster_ids = known_roster_ids | current_roster_ids
-            async_add_entities(new_entities)
+                for roster_id in sorted(new_roster_ids)
+            ]
+        )
 
     coordinator.async_add_listener(_async_check_new_rosters)